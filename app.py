@@ -1,14 +1,20 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from pathlib import Path
-import tempfile
-import zipfile
+import csv
+import hashlib
 import io
+import os
+import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from main import BankStatementParser
 
+# plotly (~300ms import) and zipfile are deferred into the functions that
+# need them, so the welcome screen renders without paying their import cost.
+
 # Page configuration
 st.set_page_config(
     page_title="Bank Statement Parser",
@@ -33,67 +39,166 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def parse_pdf_file(uploaded_file, progress_bar=None, status_text=None):
-    """Parse a single PDF file and return extracted data."""
+# Content-addressed cache of parsed results (blake2b of PDF bytes -> result).
+# A plain module-level dict rather than st.cache_data because cache hits are
+# resolved in the main process before any work is submitted to the pool.
+_PARSE_CACHE = {}
+_PARSE_CACHE_MAX_ENTRIES = 64
+
+
+def _cache_key(file_bytes):
+    """Return the content hash used to key the parse cache."""
+    return hashlib.blake2b(file_bytes).hexdigest()
+
+
+def _cache_result(key, result):
+    """Store a parsed result, evicting the oldest entry when full."""
+    if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX_ENTRIES:
+        _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+    _PARSE_CACHE[key] = result
+
+
+def _dict_to_csv(d):
+    """Serialize a flat dict as a one-row CSV, without a DataFrame detour.
+
+    Building a pandas DataFrame just to emit a single row costs orders of
+    magnitude more than writing the two lines directly; csv.writer handles
+    quoting/escaping.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(d.keys())
+    writer.writerow(str(v) for v in d.values())
+    return buffer.getvalue().encode()
+
+
+def parse_pdf_file(filename, file_bytes, spool_dir):
+    """Parse a single PDF (raw bytes) and return extracted data.
+
+    Takes plain bytes + filename instead of the Streamlit UploadedFile so it
+    can be pickled and run inside a ProcessPoolExecutor worker.
+
+    The transactions and legends DataFrames are spooled to parquet in
+    `spool_dir` rather than returned: large batches would otherwise keep
+    every DataFrame resident in session_state across all reruns (an OOM on
+    small containers). Only metadata, totals and the parquet paths travel
+    back over IPC; tabs page the frames in lazily when viewed.
+    """
     try:
-        # Save uploaded file to temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_path = tmp_file.name
-
-        # Create progress callback for Streamlit
-        def update_progress(current, total):
-            if progress_bar and status_text:
-                progress = current / total
-                status_text.text(f"Processing {uploaded_file.name} - {int(progress * 100)}% complete")
-        
-        # Parse the PDF with progress tracking
-        parser = BankStatementParser(tmp_path, progress_callback=update_progress)
-        metadata, transactions, totals, legends = parser.parse()
-
-        # Clean up temp file
-        Path(tmp_path).unlink()
+        # Each file already runs in its own worker process, so disable the
+        # parser's internal page-level pool to avoid oversubscribing cores.
+        # The parser reads the bytes directly - no temp-file round-trip.
+        # The context manager closes the bytes-backed document as soon as
+        # parsing finishes, instead of waiting for garbage collection.
+        with BankStatementParser(file_bytes, use_parallel=False) as parser:
+            metadata, transactions, totals, legends = parser.parse()
+
+        base = Path(spool_dir) / uuid.uuid4().hex
+        tx_path = str(base) + '_tx.parquet'
+        legends_path = str(base) + '_legends.parquet'
+        transactions.to_parquet(tx_path, compression='zstd')
+        legends.to_parquet(legends_path, compression='zstd')
 
         return {
             'success': True,
-            'filename': uploaded_file.name,
+            'filename': filename,
             'metadata': metadata,
-            'transactions': transactions,
             'totals': totals,
-            'legends': legends,
+            'tx_path': tx_path,
+            'legends_path': legends_path,
+            'n_transactions': len(transactions),
+            'n_legends': len(legends),
+            # Serialize the small single-row CSVs exactly once; the large
+            # transactions/legends CSVs are derived lazily from parquet.
+            '_csv': {
+                'metadata': _dict_to_csv(metadata),
+                'totals': _dict_to_csv(totals),
+            },
             'error': None
         }
     except Exception as e:
         return {
             'success': False,
-            'filename': uploaded_file.name,
+            'filename': filename,
             'error': str(e)
         }
 
 
+@st.cache_data(show_spinner=False)
+def _load_frame(path, mtime):
+    """Lazily load a spooled parquet frame; mtime keys cache invalidation."""
+    return pd.read_parquet(path)
+
+
+def _spooled_frame(result, kind):
+    """Return the transactions/legends DataFrame for a result, from parquet."""
+    path = result[f'{kind}_path' if kind == 'tx' else 'legends_path']
+    return _load_frame(path, os.path.getmtime(path))
+
+
+@st.cache_data(show_spinner=False)
+def _frame_csv(path, mtime):
+    """CSV bytes for a spooled frame, encoded once per file content."""
+    return pd.read_parquet(path).to_csv(index=False).encode()
+
+
+def _result_csv(result, kind):
+    """CSV bytes for any of a result's exports, small dicts or spooled frames."""
+    if kind in result['_csv']:
+        return result['_csv'][kind]
+    path = result['tx_path'] if kind == 'transactions' else result['legends_path']
+    return _frame_csv(path, os.path.getmtime(path))
+
+
 def create_summary_metrics(all_results):
     """Create summary metrics from all processed statements."""
-    total_statements = len([r for r in all_results if r['success']])
-    total_transactions = sum(len(r['transactions']) for r in all_results if r['success'])
-    total_withdrawals = sum(r['totals'].get('withdrawals', 0) for r in all_results if r['success'])
-    total_deposits = sum(r['totals'].get('deposits', 0) for r in all_results if r['success'])
+    successful = [r for r in all_results if r['success']]
+
+    # Sum the totals in one vectorized pass instead of a Python loop per metric
+    totals_df = pd.DataFrame([r['totals'] for r in successful])
+    for col in ('withdrawals', 'deposits'):
+        if col not in totals_df.columns:
+            totals_df[col] = 0.0
+    sums = totals_df[['withdrawals', 'deposits']].sum()
 
     return {
-        'statements': total_statements,
-        'transactions': total_transactions,
-        'withdrawals': total_withdrawals,
-        'deposits': total_deposits,
-        'net_change': total_deposits - total_withdrawals
+        'statements': len(successful),
+        'transactions': sum(r['n_transactions'] for r in successful),
+        'withdrawals': sums['withdrawals'],
+        'deposits': sums['deposits'],
+        'net_change': sums['deposits'] - sums['withdrawals']
     }
 
 
+# Skip the modebar toolbar on every chart - less to render client-side
+_PLOTLY_CONFIG = {'displayModeBar': False}
+
+# Hash DataFrames by content so cached figures survive Streamlit reruns
+_DATAFRAME_HASH_FUNCS = {
+    pd.DataFrame: lambda df: pd.util.hash_pandas_object(df, index=True).values.tobytes()
+}
+
+
+@st.cache_data(hash_funcs=_DATAFRAME_HASH_FUNCS)
 def create_transaction_chart(transactions_df):
     """Create a transaction timeline chart."""
+    import plotly.express as px
+
     if transactions_df.empty or 'Transaction Date' not in transactions_df.columns:
         return None
 
-    # Count transactions by date
-    trans_by_date = transactions_df.groupby('Transaction Date').size().reset_index(name='Count')
+    # Count transactions by date: value_counts on datetime64 hashes in C
+    # rather than comparing object strings, and int32 halves the Arrow
+    # payload shipped to plotly.js
+    dates = pd.to_datetime(transactions_df['Transaction Date'], errors='coerce',
+                           dayfirst=True, cache=True)
+    trans_by_date = (
+        dates.value_counts()
+        .sort_index()
+        .astype('int32')
+        .rename_axis('Transaction Date')
+        .reset_index(name='Count')
+    )
 
     fig = px.line(
         trans_by_date,
@@ -103,11 +208,15 @@ def create_transaction_chart(transactions_df):
         labels={'Transaction Date': 'Date', 'Count': 'Number of Transactions'}
     )
     fig.update_traces(mode='lines+markers')
+    fig.update_layout(template=None)
     return fig
 
 
+@st.cache_data
 def create_amount_comparison_chart(totals):
     """Create a bar chart comparing withdrawals and deposits."""
+    import plotly.graph_objects as go
+
     fig = go.Figure(data=[
         go.Bar(name='Withdrawals', x=['Total'], y=[totals.get('withdrawals', 0)], marker_color='red'),
         go.Bar(name='Deposits', x=['Total'], y=[totals.get('deposits', 0)], marker_color='green')
@@ -115,13 +224,17 @@ def create_amount_comparison_chart(totals):
     fig.update_layout(
         title='Withdrawals vs Deposits',
         yaxis_title='Amount (INR)',
-        barmode='group'
+        barmode='group',
+        template=None
     )
     return fig
 
 
+@st.cache_data
 def create_balance_chart(totals):
     """Create a simple balance change visualization."""
+    import plotly.graph_objects as go
+
     opening = totals.get('opening_balance', 0)
     closing = totals.get('closing_balance', 0)
 
@@ -132,39 +245,47 @@ def create_balance_chart(totals):
             marker_color=['lightblue', 'darkblue']
         )
     ])
-    fig.update_layout(title='Account Balance', yaxis_title='Amount (INR)')
+    fig.update_layout(title='Account Balance', yaxis_title='Amount (INR)',
+                      template=None)
     return fig
 
 
 def create_zip_download(all_results):
-    """Create a ZIP file containing all CSVs."""
-    zip_buffer = io.BytesIO()
+    """Write a ZIP of all CSVs to a temp file and return its path.
+
+    Building the archive on disk keeps peak memory flat regardless of batch
+    size, and the entries reuse the CSV bytes already serialized at parse
+    time instead of re-encoding each DataFrame.
+    """
+    import zipfile
+
+    tmp = tempfile.NamedTemporaryFile(suffix='.zip', delete=False)
 
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+    # Level 1 deflate roughly halves compression CPU for ~5% larger output,
+    # and entries too small to benefit from deflate are stored uncompressed.
+    # Prefer Zstandard when the stdlib supports it (Python 3.14+): similar
+    # ratios, much faster to compress and decompress.
+    compression = getattr(zipfile, 'ZIP_ZSTANDARD', zipfile.ZIP_DEFLATED)
+    compresslevel = 3 if compression != zipfile.ZIP_DEFLATED else 1
+
+    with zipfile.ZipFile(tmp, 'w', compression=compression,
+                         compresslevel=compresslevel) as zip_file:
         for result in all_results:
             if not result['success']:
                 continue
 
             filename_base = Path(result['filename']).stem
 
-            # Add metadata CSV
-            metadata_csv = pd.DataFrame([result['metadata']]).to_csv(index=False)
-            zip_file.writestr(f"{filename_base}_metadata.csv", metadata_csv)
-
-            # Add transactions CSV
-            transactions_csv = result['transactions'].to_csv(index=False)
-            zip_file.writestr(f"{filename_base}_transactions.csv", transactions_csv)
-
-            # Add totals CSV
-            totals_csv = pd.DataFrame([result['totals']]).to_csv(index=False)
-            zip_file.writestr(f"{filename_base}_totals.csv", totals_csv)
+            for kind in ('metadata', 'transactions', 'totals', 'legends'):
+                data = _result_csv(result, kind)
+                zip_file.writestr(
+                    f"{filename_base}_{kind}.csv",
+                    data,
+                    compress_type=zipfile.ZIP_STORED if len(data) < 4096 else None
+                )
 
-            # Add legends CSV
-            legends_csv = result['legends'].to_csv(index=False)
-            zip_file.writestr(f"{filename_base}_legends.csv", legends_csv)
-
-    zip_buffer.seek(0)
-    return zip_buffer
+    tmp.close()
+    return tmp.name
 
 
 def main():
@@ -191,9 +312,14 @@ def main():
         st.markdown("### About")
         st.info("This app extracts:\n- Account metadata\n- Transaction details\n- Summary totals\n- Transaction codes")
 
-    # Initialize session state
+    # Initialize session state: results are bucketed by outcome at insertion
+    # so reruns never re-scan the full list filtering on r['success']
     if 'processed_results' not in st.session_state:
-        st.session_state.processed_results = []
+        st.session_state.processed_results = {'ok': [], 'err': []}
+
+    # Per-session spool directory for parquet offload of parsed frames
+    if 'spool_dir' not in st.session_state:
+        st.session_state.spool_dir = tempfile.mkdtemp(prefix='statement_spool_')
 
     # Process button
     if uploaded_files:
@@ -202,37 +328,89 @@ def main():
             process_button = st.button("🔄 Process All PDFs", type="primary", use_container_width=True)
         with col2:
             if st.button("🗑️ Clear All", use_container_width=True):
-                st.session_state.processed_results = []
+                st.session_state.processed_results = {'ok': [], 'err': []}
                 st.rerun()
 
         if process_button:
-            st.session_state.processed_results = []
+            st.session_state.processed_results = {'ok': [], 'err': []}
 
             # Progress bar
             progress_bar = st.progress(0)
             status_text = st.empty()
 
-            for idx, uploaded_file in enumerate(uploaded_files):
-                status_text.text(f"Processing {uploaded_file.name}...")
-                result = parse_pdf_file(uploaded_file, progress_bar, status_text)
-                st.session_state.processed_results.append(result)
-                progress_bar.progress((idx + 1) / len(uploaded_files))
+            # Parse files in parallel - parsing is CPU-bound, so one worker
+            # process per file gives near-linear speedup on batch uploads.
+            # Files whose content was already parsed are served from cache
+            # and never hit the pool.
+            file_data = [(f.name, f.getvalue()) for f in uploaded_files]
+            to_parse = []
+            for name, data in file_data:
+                key = _cache_key(data)
+                cached = _PARSE_CACHE.get(key)
+                if cached is not None:
+                    st.session_state.processed_results['ok'].append(
+                        {**cached, 'filename': name}
+                    )
+                else:
+                    to_parse.append((key, name, data))
+
+            if to_parse:
+                max_workers = min(os.cpu_count() or 1, 4)
+
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(parse_pdf_file, name, data,
+                                        st.session_state.spool_dir): (key, name)
+                        for key, name, data in to_parse
+                    }
+
+                    # Throttle UI updates to ~10/s: each progress/text call is
+                    # a websocket round-trip and client re-render, which swamps
+                    # the loop when many small PDFs finish in quick succession.
+                    completed = 0
+                    last_update = 0.0
+                    for future in as_completed(futures):
+                        key, name = futures[future]
+                        result = future.result()
+                        if result['success']:
+                            _cache_result(key, result)
+                            st.session_state.processed_results['ok'].append(result)
+                        else:
+                            st.session_state.processed_results['err'].append(result)
+                        completed += 1
+
+                        now = time.perf_counter()
+                        if now - last_update > 0.1 or completed == len(to_parse):
+                            status_text.text(f"Processed {name}...")
+                            progress_bar.progress(completed / len(to_parse))
+                            last_update = now
+
+            # Build each statement's figures once; they live in session_state
+            # with the result, so reruns (tab switches, scrolls) reuse them
+            # instead of reconstructing every Plotly figure server-side.
+            for result in st.session_state.processed_results['ok']:
+                if '_figs' not in result:
+                    result['_figs'] = {
+                        'amount': create_amount_comparison_chart(result['totals']),
+                        'balance': create_balance_chart(result['totals']),
+                        'tx': create_transaction_chart(_spooled_frame(result, 'tx')),
+                    }
 
             status_text.empty()
             progress_bar.empty()
             st.success(f"✅ Processed {len(uploaded_files)} file(s)!")
 
     # Display results
-    if st.session_state.processed_results:
+    if st.session_state.processed_results['ok'] or st.session_state.processed_results['err']:
         # Show errors if any
-        errors = [r for r in st.session_state.processed_results if not r['success']]
+        errors = st.session_state.processed_results['err']
         if errors:
             st.error(f"⚠️ {len(errors)} file(s) failed to process:")
             for error in errors:
                 st.warning(f"• {error['filename']}: {error['error']}")
 
         # Summary Dashboard
-        successful_results = [r for r in st.session_state.processed_results if r['success']]
+        successful_results = st.session_state.processed_results['ok']
 
         if successful_results:
             st.markdown("## 📊 Summary Dashboard")
@@ -258,14 +436,28 @@ def main():
             # Bulk download
             st.markdown("## 📥 Download All Data")
 
-            zip_buffer = create_zip_download(successful_results)
-            st.download_button(
-                label="⬇️ Download All as ZIP",
-                data=zip_buffer,
-                file_name=f"bank_statements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
-                mime="application/zip",
-                use_container_width=True
-            )
+            # Rebuild the archive only when the result set changes; reruns
+            # (tab switches, pagination) reuse the cached file, and a stale
+            # archive is unlinked before its replacement is written so /tmp
+            # holds at most one ZIP at a time.
+            zip_key = tuple(r['tx_path'] for r in successful_results)
+            cached_key, cached_path = st.session_state.get('zip_download', (None, None))
+            if (cached_path is None or cached_key != zip_key
+                    or not Path(cached_path).exists()):
+                if cached_path is not None:
+                    Path(cached_path).unlink(missing_ok=True)
+                st.session_state.zip_download = (
+                    zip_key, create_zip_download(successful_results))
+
+            zip_path = st.session_state.zip_download[1]
+            with open(zip_path, 'rb') as zip_file:
+                st.download_button(
+                    label="⬇️ Download All as ZIP",
+                    data=zip_file,
+                    file_name=f"bank_statements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
+                    mime="application/zip",
+                    use_container_width=True
+                )
 
             st.markdown("---")
 
@@ -274,7 +466,7 @@ def main():
 
             tabs = st.tabs([f"📋 {r['filename']}" for r in successful_results])
 
-            for tab, result in zip(tabs, successful_results):
+            for idx, (tab, result) in enumerate(zip(tabs, successful_results)):
                 with tab:
                     # Account metadata
                     st.subheader("Account Information")
@@ -317,38 +509,63 @@ def main():
 
                     viz_col1, viz_col2 = st.columns(2)
 
+                    figs = result.get('_figs', {})
+
                     with viz_col1:
-                        amount_chart = create_amount_comparison_chart(totals)
+                        amount_chart = figs.get('amount')
                         if amount_chart:
-                            st.plotly_chart(amount_chart, use_container_width=True)
+                            st.plotly_chart(amount_chart, use_container_width=True,
+                                            config=_PLOTLY_CONFIG)
 
                     with viz_col2:
-                        balance_chart = create_balance_chart(totals)
+                        balance_chart = figs.get('balance')
                         if balance_chart:
-                            st.plotly_chart(balance_chart, use_container_width=True)
+                            st.plotly_chart(balance_chart, use_container_width=True,
+                                            config=_PLOTLY_CONFIG)
 
-                    transaction_chart = create_transaction_chart(result['transactions'])
+                    transaction_chart = figs.get('tx')
                     if transaction_chart:
-                        st.plotly_chart(transaction_chart, use_container_width=True)
+                        st.plotly_chart(transaction_chart, use_container_width=True,
+                                        config=_PLOTLY_CONFIG)
 
                     # Transactions table
                     st.markdown("---")
                     st.subheader("Transactions")
 
-                    if not result['transactions'].empty:
+                    if result['n_transactions'] > 0:
+                        # Page the spooled frame in only when this tab renders
+                        transactions_df = _spooled_frame(result, 'tx')
+
+                        # Paginate so only one page of rows crosses the
+                        # websocket per render instead of the whole table
+                        page_size = 100
+                        total_rows = result['n_transactions']
+                        total_pages = max(1, -(-total_rows // page_size))
+
+                        if total_pages > 1:
+                            page = st.number_input(
+                                "Page", 1, total_pages, 1,
+                                key=f"tx_page_{idx}",
+                                help=f"{total_rows} transactions, {page_size} per page"
+                            )
+                        else:
+                            page = 1
+
+                        start = (page - 1) * page_size
                         st.dataframe(
-                            result['transactions'],
+                            transactions_df.iloc[start:start + page_size],
                             use_container_width=True,
                             height=400
                         )
 
                         # Download individual CSV
-                        csv = result['transactions'].to_csv(index=False)
+                        tx_csv = _result_csv(result, 'transactions')
                         st.download_button(
                             label="📊 Download Transactions CSV",
-                            data=csv,
+                            data=tx_csv,
                             file_name=f"{Path(result['filename']).stem}_transactions.csv",
-                            mime="text/csv"
+                            mime="text/csv",
+                            key=f"dl_{idx}_tx_table"
                         )
                     else:
                         st.warning("No transactions found")
@@ -356,8 +573,9 @@ def main():
                     # Legends
                     st.markdown("---")
                     with st.expander("📖 Transaction Code Legends"):
-                        if not result['legends'].empty:
-                            st.dataframe(result['legends'], use_container_width=True)
+                        if result['n_legends'] > 0:
+                            st.dataframe(_spooled_frame(result, 'legends'),
+                                         use_container_width=True)
                         else:
                             st.info("No legends found")
 
@@ -368,43 +586,47 @@ def main():
                     dl_col1, dl_col2, dl_col3, dl_col4 = st.columns(4)
 
                     with dl_col1:
-                        metadata_csv = pd.DataFrame([result['metadata']]).to_csv(index=False)
+                        metadata_csv = result['_csv']['metadata']
                         st.download_button(
                             label="📄 Metadata",
                             data=metadata_csv,
                             file_name=f"{Path(result['filename']).stem}_metadata.csv",
                             mime="text/csv",
-                            use_container_width=True
+                            use_container_width=True,
+                            key=f"dl_{idx}_meta"
                         )
 
                     with dl_col2:
-                        trans_csv = result['transactions'].to_csv(index=False)
+                        trans_csv = _result_csv(result, 'transactions')
                         st.download_button(
                             label="📊 Transactions",
                             data=trans_csv,
                             file_name=f"{Path(result['filename']).stem}_transactions.csv",
                             mime="text/csv",
-                            use_container_width=True
+                            use_container_width=True,
+                            key=f"dl_{idx}_tx"
                         )
 
                     with dl_col3:
-                        totals_csv = pd.DataFrame([result['totals']]).to_csv(index=False)
+                        totals_csv = result['_csv']['totals']
                         st.download_button(
                             label="💰 Totals",
                             data=totals_csv,
                             file_name=f"{Path(result['filename']).stem}_totals.csv",
                             mime="text/csv",
-                            use_container_width=True
+                            use_container_width=True,
+                            key=f"dl_{idx}_totals"
                         )
 
                     with dl_col4:
-                        legends_csv = result['legends'].to_csv(index=False)
+                        legends_csv = _result_csv(result, 'legends')
                         st.download_button(
                             label="📖 Legends",
                             data=legends_csv,
                             file_name=f"{Path(result['filename']).stem}_legends.csv",
                             mime="text/csv",
-                            use_container_width=True
+                            use_container_width=True,
+                            key=f"dl_{idx}_legends"
                         )
 
     else:
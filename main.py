@@ -1,14 +1,162 @@
+import bisect
 import camelot
+import math
+import os
 import pymupdf as fitz  # PyMuPDF
 import pathlib
 import pandas as pd
 import re
+import types
 from typing import Dict, List, Tuple, Optional, Callable
-from multiprocessing import Pool, cpu_count
-from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from multiprocessing import cpu_count, get_context
+from functools import lru_cache
 import numpy as np
 from tqdm import tqdm
 
+# Camelot's stream-flavor TextEdges calls np.isclose on pairs of native
+# Python floats inside an O(n^2) loop; the per-call NumPy dispatch dominates
+# its profile. The scalar branch reproduces numpy's own test (the
+# asymmetric atol + rtol*|b| bound, equal_nan, and infinities) without the
+# array machinery, and everything else defers to the original ufunc. The
+# wrapper is installed on a shim module swapped in as camelot.core's 'np'
+# binding, so only Camelot sees it - the shared numpy module is untouched.
+# Guarded so an import-time failure leaves the stock implementation alone.
+try:
+    _np_isclose = np.isclose
+
+    def _scalar_first_isclose(a, b, rtol=1e-05, atol=1e-08, equal_nan=False):
+        if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+            if math.isnan(a) or math.isnan(b):
+                return bool(equal_nan) and math.isnan(a) and math.isnan(b)
+            if math.isinf(a) or math.isinf(b):
+                return a == b
+            return abs(a - b) <= atol + rtol * abs(b)
+        return _np_isclose(a, b, rtol=rtol, atol=atol, equal_nan=equal_nan)
+
+    _camelot_np = types.ModuleType('numpy')
+    _camelot_np.__dict__.update(np.__dict__)
+    _camelot_np.isclose = _scalar_first_isclose
+    camelot.core.np = _camelot_np
+except Exception:
+    pass
+
+# pyarrow ships with streamlit but is not a hard dependency of the parser;
+# when present, string columns use Arrow-backed storage (contiguous UTF-8,
+# C string kernels, roughly half the memory of object arrays)
+try:
+    import pyarrow as pa
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Copy-on-Write makes shallow operations (reset_index, slicing, column
+# assignment) lazy, so the per-table frames below are never deep-copied
+# defensively. Always on (and the option deprecated) from pandas 3.0, so
+# only set it where it still exists.
+try:
+    pd.set_option('mode.copy_on_write', True)
+except Exception:
+    pass
+
+@lru_cache(maxsize=8)
+def _open_pdf(path: str, mtime: float) -> fitz.Document:
+    """Open a PDF once per (path, mtime) and reuse the parsed document.
+
+    Repeated BankStatementParser construction against the same file (batch
+    reruns, schema tweaks) skips MuPDF's xref/stream parse on cache hits.
+    The cache owns these documents; parser instances must not close them.
+    """
+    # filetype='pdf' skips MuPDF's format sniffing on open
+    return fitz.open(path, filetype='pdf')
+
+
+# Rows whose first column matches any of these are headers/footers/summary
+# lines, not transactions. Compiled once; combined into a single alternation
+# so filtering is one vectorized pass instead of one per fragment.
+_EXCLUSION_RE = re.compile(r'Sl|No|Page Total|Opening Bal|Legends|Tran', re.IGNORECASE)
+
+# Exceptions Camelot raises on pages it cannot parse. The fallback to the
+# stream flavor triggers only on these; anything else (KeyboardInterrupt,
+# MemoryError, ...) propagates instead of silently doubling the parse cost.
+_CAMELOT_READ_ERRORS = (ValueError, IndexError, KeyError, OSError, RuntimeError)
+
+# Compiled once; used to normalize header text for alias matching
+_NORMALIZE_RE = re.compile(r'[^a-z0-9]')
+
+# Commas and any whitespace (spaces, newlines, tabs) in amount strings,
+# removed in a single vectorized pass by _clean_amount_vectorized
+_AMOUNT_STRIP_RE = re.compile(r'[,\s]+')
+
+
+def _parse_amount_str(s: str) -> float:
+    """Single-pass amount-string parser behind the scalar _clean_amount.
+
+    One walk over the string handles separators, whitespace, and leading
+    or trailing minus signs. Kept to the string subset numba's nopython
+    mode supports so the optional compilation below can take it as-is.
+    """
+    cleaned = ''
+    negative = False
+    for ch in s:
+        if ch == ',' or ch == ' ' or ch == '\n' or ch == '\t' or ch == '\r':
+            continue
+        if ch == '-':
+            negative = True
+            continue
+        cleaned += ch
+    if len(cleaned) == 0:
+        return 0.0
+    value = float(cleaned)
+    return -value if negative else value
+
+
+# numba is optional (not a declared dependency); when available, compile
+# the scalar kernel and keep it only if compilation actually succeeds on
+# a representative input — otherwise the pure-Python version stands.
+try:
+    from numba import njit
+    _jitted_parse = njit(cache=True)(_parse_amount_str)
+    _jitted_parse('1,234.50-')
+    _parse_amount_str = _jitted_parse
+except Exception:
+    pass
+
+# Metadata fields as one named-group alternation: a single finditer pass
+# scans the first-page text once instead of twelve independent searches.
+# Each value's lookahead bound is the label that follows it on the real
+# statement, so no field's capture spans another field's label and the
+# single left-to-right scan finds every field.
+_METADATA_FIELD_PATTERNS = {
+    'name': r'Name:\s*(?P<name>.+?)(?=\s+A/C Branch:)',
+    'address': r'Address:\s*(?P<address>.+?)(?=A/C No:)',
+    'account_number': r'A/C No:\s*(?P<account_number>\d+)',
+    'account_type': r'A/C Type:\s*(?P<account_type>\w+)',
+    'customer_id': r'Cust ID:\s*(?P<customer_id>\d+)',
+    'branch': r'A/C Branch:\s*(?P<branch>.+?)(?=Branch Address:)',
+    'branch_address': r'Branch Address:\s*(?P<branch_address>.+?)(?=A/C Type:)',
+    'branch_code': r'Branch Code:\s*(?P<branch_code>\d+)',
+    'ifsc_code': r'IFSC Code:\s*(?P<ifsc_code>\w+)',
+    'transaction_period': r'Transaction Period:\s*(?P<transaction_period>.+?)(?=IFSC Code:)',
+    'statement_date': r'Statement\s+Request/Download\s+Date:\s*(?P<statement_date>\d{2}/\d{2}/\d{4})',
+    'currency': r'Account Currency:\s*(?P<currency>\w+)',
+}
+
+_METADATA_RE = re.compile('|'.join(_METADATA_FIELD_PATTERNS.values()), re.DOTALL)
+
+_TOTALS_PATTERNS = {
+    'opening_balance': re.compile(r'Opening Bal:\s*([-]?[\d,]+\.[\d]+)'),
+    'withdrawals': re.compile(r'Withdrawls:\s*([\d,]+\.[\d]+)'),
+    'deposits': re.compile(r'Deposits:\s*([\d,]+\.[\d]+)'),
+    'closing_balance': re.compile(r'Closing Bal:\s*([-]?[\d,]+\.[\d]+)'),
+}
+
+# Legend entries look like "1. NEFT - National Electronic Funds Transfer".
+# The description is matched line-by-line with a bounded lookahead for the
+# next "N." entry instead of a non-greedy dot-all capture, keeping runtime
+# linear on malformed text dumps where the lazy form can backtrack badly.
+_LEGEND_PATTERN = re.compile(r'(\d+)\.\s+([A-Z/\s]+?)\s+-\s+([^\n]+(?:\n(?!\d+\.)[^\n]*)*)')
+
 
 class BankStatementParser:
     """Parser for ICICI Bank detailed statement PDFs."""
@@ -32,149 +180,356 @@ class BankStatementParser:
         'Balance': ['Balance', 'Running Balance', 'Closing Balance']
     }
 
-    def __init__(self, pdf_path: str, max_workers: Optional[int] = None, 
+    # Normalized alias -> canonical column, built once at class definition
+    # instead of lazily per instance (workers bypass __init__ via __new__)
+    _ALIAS_LOOKUP = {
+        _NORMALIZE_RE.sub('', alias.lower()): canonical
+        for canonical, aliases in TRANSACTION_COLUMN_ALIASES.items()
+        for alias in aliases
+    }
+
+    def __init__(self, pdf_source, max_workers: Optional[int] = None,
                  chunk_size: int = 15, use_parallel: bool = True,
                  progress_callback: Optional[Callable[[int, int], None]] = None):
-        self.pdf_path = pathlib.Path(pdf_path)
-        self.doc = fitz.open(str(self.pdf_path))
+        """Accept either a filesystem path or in-memory PDF bytes/file-like."""
+        if isinstance(pdf_source, (str, pathlib.Path)):
+            self.pdf_path = pathlib.Path(pdf_source)
+            self._pdf_bytes = None
+            self.doc = _open_pdf(str(self.pdf_path), os.path.getmtime(self.pdf_path))
+            self._owns_doc = False
+        else:
+            # Bytes or binary file-like: parse straight from memory, no disk I/O
+            self.pdf_path = None
+            self._pdf_bytes = pdf_source if isinstance(pdf_source, bytes) else pdf_source.read()
+            self.doc = fitz.open(stream=self._pdf_bytes, filetype='pdf')
+            self._owns_doc = True
+        self._tmp_pdf_path = None
+        self._preferred_flavor = None
+        self._page_text_cache: Dict[int, str] = {}
         self.total_pages = len(self.doc)
-        self.max_workers = max_workers or min(cpu_count(), 8)
+        # Camelot chunk throughput plateaus well before 8 workers (the
+        # chunks are I/O-heavy and Ghostscript/pdfminer contend on memory
+        # bandwidth), so cap the default at 6
+        self.max_workers = max_workers or min(cpu_count(), 6)
         self.chunk_size = chunk_size
         self.use_parallel = use_parallel and self.total_pages > 20
         self.progress_callback = progress_callback
 
+    def _pdf_filepath(self) -> str:
+        """Return an on-disk path for the PDF, spooling in-memory bytes once.
+
+        Camelot only reads from the filesystem, so a parser constructed from
+        bytes lazily writes a temp file the first time tables are extracted.
+        PyMuPDF-based extraction never needs this.
+        """
+        if self.pdf_path is not None:
+            return str(self.pdf_path)
+        if self._tmp_pdf_path is None:
+            import tempfile
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
+                tmp.write(self._pdf_bytes)
+                self._tmp_pdf_path = tmp.name
+        return self._tmp_pdf_path
+
+    def _get_page_text(self, page_index: int) -> str:
+        """Memoized plain-text extraction for one page.
+
+        MuPDF text extraction is O(page content), and the first and tail
+        pages are each read by more than one extractor; caching the string
+        turns repeat reads into dict lookups. Plain-text mode with the
+        text-only flag set: no block/span/char tree and no image info, just
+        the string the regexes need.
+        """
+        text = self._page_text_cache.get(page_index)
+        if text is None:
+            text = self.doc[page_index].get_text('text', flags=fitz.TEXTFLAGS_TEXT)
+            self._page_text_cache[page_index] = text
+        return text
+
     def extract_account_metadata(self) -> Dict[str, str]:
         """Extract account information from the first page."""
-        first_page = self.doc[0]
-        text = first_page.get_text()
+        text = self._get_page_text(0)
 
         metadata = {}
 
-        # Extract key fields using regex patterns
-        patterns = {
-            'name': r'Name:\s*(.+?)(?=\s+A/C Branch:)',
-            'address': r'Address:\s*(.+?)(?=A/C No:)',
-            'account_number': r'A/C No:\s*(\d+)',
-            'account_type': r'A/C Type:\s*(\w+)',
-            'customer_id': r'Cust ID:\s*(\d+)',
-            'branch': r'A/C Branch:\s*(.+?)(?=Branch Address:)',
-            'branch_address': r'Branch Address:\s*(.+?)(?=A/C Type:)',
-            'branch_code': r'Branch Code:\s*(\d+)',
-            'ifsc_code': r'IFSC Code:\s*(\w+)',
-            'transaction_period': r'Transaction Period:\s*(.+?)(?=IFSC Code:)',
-            'statement_date': r'Statement\s+Request/Download\s+Date:\s*(\d{2}/\d{2}/\d{4})',
-            'currency': r'Account Currency:\s*(\w+)',
-        }
-
-        for key, pattern in patterns.items():
-            match = re.search(pattern, text, re.DOTALL)
-            if match:
-                metadata[key] = match.group(1).strip().replace('\n', ' ')
+        # Single scan: each match sets exactly one named group, identified
+        # by lastgroup. Keep the first hit per field, matching the old
+        # per-pattern search semantics.
+        for match in _METADATA_RE.finditer(text):
+            key = match.lastgroup
+            if key not in metadata:
+                metadata[key] = match.group(key).strip().replace('\n', ' ')
 
         return metadata
 
     def extract_transactions(self) -> pd.DataFrame:
-        """Extract transaction table from all pages using Camelot with parallel processing."""
-        if self.use_parallel:
-            return self._extract_transactions_parallel()
-        else:
-            return self._extract_transactions_sequential()
+        """Extract the transaction table from all pages.
+
+        Tries the PyMuPDF word-binning fast path first - ICICI statements are
+        text-based with fixed column positions, so no Ghostscript rendering or
+        PDFMiner layout analysis is needed. Falls back to Camelot when the
+        layout cannot be recognized.
+        """
+        try:
+            try:
+                fast_df = self.extract_transactions_fast()
+            except Exception as e:
+                print(f"Fast extraction failed ({e}), falling back to Camelot...")
+                fast_df = pd.DataFrame()
+
+            if len(fast_df) > 0:
+                return fast_df
+
+            all_transactions = []
+            for chunk_transactions in self._iter_chunk_tables():
+                all_transactions.extend(chunk_transactions)
+            return self._combine_and_clean_transactions(all_transactions)
+        finally:
+            # Evict MuPDF's internal object cache, which otherwise grows with
+            # every page touched and lives until the document is closed
+            fitz.TOOLS.store_shrink(100)
+
+    def extract_transactions_fast(self) -> pd.DataFrame:
+        """Extract transactions by binning PyMuPDF words into fixed columns.
+
+        Column x-boundaries are derived once from the header row on the first
+        page; every word on every page is then assigned to a column with a
+        bisect on its centre. Returns an empty DataFrame when no header row
+        is found, which signals the caller to use the Camelot path.
+        """
+        boundaries = self._detect_column_boundaries()
+        if not boundaries:
+            return pd.DataFrame()
+
+        n_cols = len(self.EXPECTED_TRANSACTION_COLUMNS)
+        all_transactions = []
+
+        pages = range(self.total_pages)
+        for page_num in tqdm(pages, desc="Extracting words", unit="page"):
+            words = self.doc[page_num].get_text('words')
+            if not words:
+                continue
+
+            # Cluster words into rows by vertical position
+            rows: List[Tuple[float, list]] = []
+            for word in sorted(words, key=lambda w: (w[1], w[0])):
+                if rows and abs(word[1] - rows[-1][0]) <= 3.0:
+                    rows[-1][1].append(word)
+                else:
+                    rows.append((word[1], [word]))
+
+            page_columns: Dict[str, list] = {
+                col: [] for col in self.EXPECTED_TRANSACTION_COLUMNS
+            }
+            for _, row_words in rows:
+                cells = [[] for _ in range(n_cols)]
+                for x0, _, x1, _, text, *_ in row_words:
+                    col_idx = bisect.bisect(boundaries, (x0 + x1) / 2)
+                    if col_idx < n_cols:
+                        cells[col_idx].append(text)
+                for col, cell in zip(self.EXPECTED_TRANSACTION_COLUMNS, cells):
+                    page_columns[col].append(' '.join(cell))
+
+            page_df = self._filter_non_transaction_rows(pd.DataFrame(page_columns))
+            if len(page_df) > 0:
+                all_transactions.append(
+                    {col: page_df[col].tolist() for col in self.EXPECTED_TRANSACTION_COLUMNS}
+                )
+
+            if self.progress_callback:
+                self.progress_callback(page_num + 1, self.total_pages)
 
-    def _extract_transactions_sequential(self) -> pd.DataFrame:
-        """Sequential extraction for smaller PDFs."""
-        print(f"Extracting tables from {self.total_pages} pages (sequential mode)...")
-        all_transactions = self._process_page_range(1, self.total_pages, show_progress=True)
         return self._combine_and_clean_transactions(all_transactions)
 
-    def _extract_transactions_parallel(self) -> pd.DataFrame:
+    def _detect_column_boundaries(self) -> List[float]:
+        """Derive column cut points from the header row on the first page.
+
+        Header words are clustered into column groups by horizontal gaps;
+        the boundaries are the midpoints between adjacent groups. Returns an
+        empty list when no 'Sl' header word is found.
+        """
+        words = self.doc[0].get_text('words')
+
+        header_y = None
+        for x0, y0, x1, y1, text, *_ in words:
+            if text.strip().lower() == 'sl':
+                header_y = y0
+                break
+        if header_y is None:
+            return []
+
+        header_words = sorted(
+            (w for w in words if abs(w[1] - header_y) <= 3.0),
+            key=lambda w: w[0]
+        )
+        if len(header_words) < 2:
+            return []
+
+        # Group adjacent words into columns: a gap wider than 5pt between a
+        # word and the previous word's right edge starts a new column
+        groups: List[List[float]] = [[header_words[0][0], header_words[0][2]]]
+        for x0, _, x1, *_ in header_words[1:]:
+            if x0 - groups[-1][1] > 5.0:
+                groups.append([x0, x1])
+            else:
+                groups[-1][1] = max(groups[-1][1], x1)
+
+        if len(groups) != len(self.EXPECTED_TRANSACTION_COLUMNS):
+            return []
+
+        return [
+            (groups[i][1] + groups[i + 1][0]) / 2
+            for i in range(len(groups) - 1)
+        ]
+
+    def iter_transactions(self):
+        """Yield cleaned transaction DataFrames one page chunk at a time.
+
+        Streaming consumers (save_to_csv) use this to flush each chunk as it
+        arrives instead of holding every page's rows in memory until the end
+        of the document.
+        """
+        for chunk_transactions in self._iter_chunk_tables():
+            if chunk_transactions:
+                yield self._combine_and_clean_transactions(chunk_transactions)
+
+    def _iter_chunk_tables(self):
+        """Yield lists of canonical column dicts, one list per page chunk."""
+        if self.use_parallel:
+            yield from self._iter_chunk_tables_parallel()
+        else:
+            print(f"Extracting tables from {self.total_pages} pages (sequential mode)...")
+            yield self._process_page_range(1, self.total_pages, show_progress=True)
+
+    def _iter_chunk_tables_parallel(self):
         """Parallel extraction for large PDFs."""
         print(f"Extracting tables from {self.total_pages} pages (parallel mode with {self.max_workers} workers)...")
-        
-        # Split pages into chunks
-        page_chunks = []
-        for i in range(1, self.total_pages + 1, self.chunk_size):
-            end_page = min(i + self.chunk_size - 1, self.total_pages)
-            page_chunks.append((i, end_page))
-        
+
+        # Split pages into chunks (vectorized; one arange + clip instead of
+        # a Python loop)
+        starts = np.arange(1, self.total_pages + 1, self.chunk_size)
+        ends = np.minimum(starts + self.chunk_size - 1, self.total_pages)
+        page_chunks = list(zip(starts.tolist(), ends.tolist()))
+
         print(f"Processing {len(page_chunks)} chunks of ~{self.chunk_size} pages each...")
-        
-        # Process chunks in parallel
-        process_func = partial(self._process_page_chunk_static, str(self.pdf_path))
-        
-        all_transactions = []
-        with Pool(processes=self.max_workers) as pool:
-            # Use imap for progress tracking
-            with tqdm(total=len(page_chunks), desc="Processing chunks", unit="chunk") as pbar:
-                for chunk_transactions in pool.imap(process_func, page_chunks):
-                    all_transactions.extend(chunk_transactions)
-                    pbar.update(1)
-                    if self.progress_callback:
-                        self.progress_callback(pbar.n, len(page_chunks))
-        
-        return self._combine_and_clean_transactions(all_transactions)
 
-    @staticmethod
-    def _process_page_chunk_static(pdf_path: str, page_range: Tuple[int, int]) -> List[pd.DataFrame]:
-        """Static method for parallel processing of page chunks."""
-        start_page, end_page = page_range
-        
-        # Try lattice first, fallback to stream
-        try:
-            tables = camelot.read_pdf(
-                pdf_path,
-                pages=f'{start_page}-{end_page}',
-                flavor='lattice'
-            )
-        except:
+        # One cheap probe in the parent decides the flavor for every chunk,
+        # so workers never pay an exception-driven lattice attempt on
+        # stream-flavored documents
+        flavor = self._detect_flavor()
+
+        import tempfile
+        with tempfile.TemporaryDirectory(prefix='statement_chunks_') as chunk_dir:
+            self._split_chunk_pdfs(page_chunks, chunk_dir)
+
+            # Spawn gives identical worker behavior across platforms (fork
+            # inherits the parent's MuPDF/camelot state on Linux, spawn does
+            # not); the initializer pays the heavy camelot import once per
+            # worker at startup and pins the chunk directory so each task
+            # pickles only a short file name.
+            with ProcessPoolExecutor(max_workers=self.max_workers,
+                                     mp_context=get_context('spawn'),
+                                     initializer=_worker_init,
+                                     initargs=(chunk_dir, flavor)) as executor:
+                # Tasks are bare chunk indices; workers derive the file
+                # name via _chunk_file_name and the initializer's directory
+                futures = [executor.submit(_process_page_chunk, idx)
+                           for idx in range(len(page_chunks))]
+
+                # as_completed keeps every worker busy instead of blocking
+                # the pipeline on the slowest in-flight chunk; results are
+                # re-sequenced here so downstream consumers (CSV streaming,
+                # the combined frame) still see chunks in page order. The
+                # pending dict holds at most a few out-of-order chunks.
+                pending = {}
+                next_idx = 0
+                with tqdm(total=len(page_chunks), desc="Processing chunks", unit="chunk") as pbar:
+                    for future in as_completed(futures):
+                        idx, chunk_transactions = future.result()
+                        pending[idx] = chunk_transactions
+                        while next_idx in pending:
+                            yield pending.pop(next_idx)
+                            next_idx += 1
+                            pbar.update(1)
+                            if self.progress_callback:
+                                self.progress_callback(pbar.n, len(page_chunks))
+
+    def _detect_flavor(self) -> str:
+        """Pick the Camelot flavor for the whole document with one probe.
+
+        Lattice either works everywhere or nowhere on these fixed-layout
+        statements, so a single page-1 attempt settles it. Shares
+        _preferred_flavor with the sequential path, so whichever runs first
+        spares the other the probe.
+        """
+        if self._preferred_flavor is None:
             try:
-                tables = camelot.read_pdf(
-                    pdf_path,
-                    pages=f'{start_page}-{end_page}',
-                    flavor='stream',
-                    edge_tol=50,
-                    row_tol=10
+                probe = camelot.read_pdf(
+                    self._pdf_filepath(),
+                    pages='1',
+                    flavor='lattice',
+                    strip_text='\n'
                 )
-            except:
-                return []
-        
-        chunk_transactions = []
-        parser = BankStatementParser.__new__(BankStatementParser)
-        
-        for table in tables:
-            raw_df = table.df
-            if raw_df.shape[0] == 0:
-                continue
-            
-            df, header_lookup = parser._separate_header(raw_df)
-            if df.shape[0] == 0:
-                continue
-            
-            # Optimized filtering: combined regex pattern
-            df = parser._filter_non_transaction_rows(df)
-            
-            if len(df) > 0:
-                canonical_df = parser._map_to_canonical_transactions(df, header_lookup)
-                if not canonical_df.empty:
-                    chunk_transactions.append(canonical_df)
-        
-        return chunk_transactions
+            except _CAMELOT_READ_ERRORS:
+                probe = []
+            self._preferred_flavor = 'lattice' if len(probe) > 0 else 'stream'
+        return self._preferred_flavor
 
-    def _process_page_range(self, start_page: int, end_page: int, show_progress: bool = False) -> List[pd.DataFrame]:
+    def _split_chunk_pdfs(self, page_chunks: List[Tuple[int, int]], out_dir: str) -> List[str]:
+        """Write each page chunk to its own small PDF for the pool workers.
+
+        Camelot re-reads its source document on every read_pdf call, so a
+        worker seeking a page range into the full statement pays an
+        O(total pages) parse per chunk. Splitting once in the parent is
+        cheap (PyMuPDF copies objects without re-rendering) and leaves each
+        worker reading a file only chunk_size pages long.
+        """
+        chunk_paths = []
+        for idx, (start_page, end_page) in enumerate(page_chunks):
+            chunk_doc = fitz.open()
+            chunk_doc.insert_pdf(self.doc, from_page=start_page - 1, to_page=end_page - 1)
+            chunk_path = os.path.join(out_dir, _chunk_file_name(idx))
+            chunk_doc.save(chunk_path, garbage=1)
+            chunk_doc.close()
+            chunk_paths.append(chunk_path)
+        return chunk_paths
+
+    def _process_page_range(self, start_page: int, end_page: int, show_progress: bool = False) -> List[Dict[str, list]]:
         """Process a range of pages sequentially."""
-        try:
-            tables = camelot.read_pdf(
-                str(self.pdf_path),
-                pages=f'{start_page}-{end_page}',
-                flavor='lattice'
-            )
-        except:
+        pdf_filepath = self._pdf_filepath()
+        # 'all' lets Camelot resolve pages with a single reader pass instead
+        # of parsing an explicit range string against a reopened document
+        pages = 'all' if (start_page == 1 and end_page == self.total_pages) \
+            else f'{start_page}-{end_page}'
+
+        # Once a flavor has worked for this document, go straight to it on
+        # later invocations instead of re-paying a failed lattice attempt.
+        tables = None
+        if self._preferred_flavor != 'stream':
+            try:
+                tables = camelot.read_pdf(
+                    pdf_filepath,
+                    pages=pages,
+                    flavor='lattice',
+                    strip_text='\n'
+                )
+            except _CAMELOT_READ_ERRORS:
+                tables = None
+            if tables is not None and len(tables) > 0:
+                self._preferred_flavor = 'lattice'
+            else:
+                tables = None
+
+        if tables is None:
             tables = camelot.read_pdf(
-                str(self.pdf_path),
-                pages=f'{start_page}-{end_page}',
+                pdf_filepath,
+                pages=pages,
                 flavor='stream',
                 edge_tol=50,
-                row_tol=10
+                row_tol=10,
+                strip_text='\n'
             )
+            self._preferred_flavor = 'stream'
         
         all_transactions = []
         iterator = tqdm(tables, desc="Processing tables") if show_progress else tables
@@ -190,11 +545,11 @@ class BankStatementParser:
             
             # Optimized filtering
             df = self._filter_non_transaction_rows(df)
-            
+
             if len(df) > 0:
-                canonical_df = self._map_to_canonical_transactions(df, header_lookup)
-                if not canonical_df.empty:
-                    all_transactions.append(canonical_df)
+                all_transactions.append(
+                    self._map_to_canonical_transactions(df, header_lookup)
+                )
         
         return all_transactions
 
@@ -202,71 +557,76 @@ class BankStatementParser:
         """Optimized row filtering with combined regex pattern."""
         if df.shape[0] == 0:
             return df
-        
-        first_col = df.iloc[:, 0].astype(str)
-        
-        # Combined regex pattern for all exclusions (3-5x faster than separate contains)
-        # Use non-capturing groups to avoid warning
-        exclusion_pattern = r'(?:Sl|No|Page Total|Opening Bal|Legends|Tran)'
-        mask = ~first_col.str.contains(exclusion_pattern, na=False, case=False, regex=True)
-        
-        # Remove empty rows
-        mask &= (first_col.str.strip() != '')
-        
-        # Only keep rows starting with a number
-        mask &= first_col.str.match(r'^\d+$', na=False)
-        
-        return df[mask]
 
-    def _combine_and_clean_transactions(self, all_transactions: List[pd.DataFrame]) -> pd.DataFrame:
-        """Combine and clean all transaction DataFrames."""
+        # One pass over the raw numpy column instead of three pandas str
+        # kernels (each of which materializes a fresh object array). isdigit
+        # on the stripped cell already covers empty rows, and a digits-only
+        # string can never match the exclusion words, but the regex check is
+        # kept as a cheap guard against layout surprises.
+        col0 = df.iloc[:, 0].to_numpy()
+        stripped = (str(v).strip() for v in col0)
+        keep = np.fromiter(
+            (s.isdigit() and not _EXCLUSION_RE.search(s) for s in stripped),
+            dtype=bool,
+            count=len(col0),
+        )
+
+        return df[keep]
+
+    def _combine_and_clean_transactions(self, all_transactions: List[Dict[str, list]]) -> pd.DataFrame:
+        """Combine per-table column lists into one cleaned DataFrame.
+
+        Each entry is either a {canonical column: values} dict from
+        _map_to_canonical_transactions or, from pool workers with pyarrow,
+        an Arrow RecordBatch. Batches concatenate by pointer via
+        Table.from_batches; dicts extend plain lists and build the frame
+        once. Both replace N per-table DataFrames + concat + reindex with
+        a single allocation.
+        """
         if not all_transactions:
             return pd.DataFrame()
-        
-        # Concatenate all transactions
-        transactions_df = pd.concat(all_transactions, ignore_index=True)
-        
-        # Handle column standardization
-        if transactions_df.shape[1] == 10:
-            # Standard 10-column Camelot output
-            # Col 0-5: Sl No through Cheque no/Ref No
-            # Col 6: Transaction Remarks  
-            # Col 7: Withdrawal (Dr) - may contain withdrawal amount
-            # Col 8: Deposit (Cr) - may contain deposit amount
-            # Col 9: Balance
-            
-            transactions_df.columns = [
-                'Sl No', 'Tran Id', 'Value Date', 'Transaction Date',
-                'Transaction Posted Date', 'Cheque no / Ref No',
-                'Transaction Remarks', 'Withdrawal (Dr)', 'Deposit (Cr)', 'Balance'
-            ]
-            
-            # Vectorized amount cleaning (much faster than apply)
-            transactions_df['Withdrawal (Dr)'] = self._clean_amount_vectorized(transactions_df['Withdrawal (Dr)'])
-            transactions_df['Deposit (Cr)'] = self._clean_amount_vectorized(transactions_df['Deposit (Cr)'])
+
+        if _HAS_PYARROW and isinstance(all_transactions[0], pa.RecordBatch):
+            table = pa.Table.from_batches(all_transactions)
+            transactions_df = table.to_pandas(types_mapper=pd.ArrowDtype)
+            # Every column arrives as an Arrow string; trim here in one
+            # C-level pass per column, since the object-column cleanup
+            # below only sees dict-built frames
+            for col in transactions_df.columns:
+                transactions_df[col] = transactions_df[col].str.strip()
         else:
-            # Fallback: ensure all canonical columns exist
-            missing_cols = [
-                col for col in self.EXPECTED_TRANSACTION_COLUMNS
-                if col not in transactions_df.columns
-            ]
-            for col in missing_cols:
-                transactions_df[col] = pd.NA
-        
-        # Reorder to the canonical schema
-        transactions_df = transactions_df[self.EXPECTED_TRANSACTION_COLUMNS]
-        
-        # Vectorized numeric column cleaning
+            columns: Dict[str, list] = {col: [] for col in self.EXPECTED_TRANSACTION_COLUMNS}
+            for table_columns in all_transactions:
+                for col in self.EXPECTED_TRANSACTION_COLUMNS:
+                    columns[col].extend(table_columns[col])
+
+            transactions_df = pd.DataFrame(columns)
+
+        # Vectorized numeric column cleaning (single pass per column); with
+        # pyarrow the result is stored Arrow-backed like the string columns
         for col in ['Withdrawal (Dr)', 'Deposit (Cr)', 'Balance']:
-            if col in transactions_df.columns:
-                transactions_df[col] = self._clean_amount_vectorized(transactions_df[col])
-        
-        # Vectorized text cleaning (single pass for all object columns)
+            cleaned = self._clean_amount_vectorized(transactions_df[col])
+            if _HAS_PYARROW:
+                cleaned = cleaned.astype('float64[pyarrow]')
+            transactions_df[col] = cleaned
+
+        # Vectorized text cleaning; newlines are already stripped by Camelot
+        # (strip_text='\n'), so only whitespace trimming remains. With
+        # pyarrow, the strip runs on Arrow string arrays instead of Python
+        # object arrays.
         object_cols = transactions_df.select_dtypes(include=['object']).columns
-        for col in object_cols:
-            # Combined operation: convert, replace, strip in one chain
-            transactions_df[col] = transactions_df[col].astype(str).str.replace('\n', ' ', regex=False).str.strip()
-        
+        if _HAS_PYARROW:
+            for col in object_cols:
+                transactions_df[col] = (
+                    transactions_df[col].astype('string[pyarrow]').str.strip()
+                )
+        else:
+            # Columns are already object arrays of str/NA, so .str.strip()
+            # applies directly; astype(str) would add a full pass just to
+            # stringify missing values
+            for col in object_cols:
+                transactions_df[col] = transactions_df[col].str.strip()
+
         return transactions_df
 
     def _clean_amount(self, amount_str: str) -> float:
@@ -275,47 +635,45 @@ class BankStatementParser:
         if isinstance(amount_str, (int, float)):
             return float(amount_str) if not pd.isna(amount_str) else 0.0
             
-        if pd.isna(amount_str) or str(amount_str).strip() in ['', '-']:
+        if pd.isna(amount_str):
             return 0.0
 
-        # Remove commas, whitespace, AND newlines
-        cleaned = str(amount_str).replace(',', '').replace(' ', '').replace('\n', '').strip()
-
-        # Handle negative amounts (some might have - at the end or start)
-        if cleaned.startswith('-'):
-            cleaned = cleaned  # Already negative
-        elif cleaned.endswith('-'):
-            cleaned = '-' + cleaned[:-1]
-
+        # Single walk over the string (jitted when numba is installed):
+        # strips separators/whitespace and normalizes the sign
         try:
-            return float(cleaned)
+            return _parse_amount_str(str(amount_str))
         except ValueError:
             return 0.0
 
-    def _clean_amount_vectorized(self, series: pd.Series) -> pd.Series:
-        """Vectorized amount cleaning - much faster than apply for large datasets."""
-        # Convert to string, handle NaN
-        s = series.astype(str)
-        
-        # Replace empty/NaN values
-        s = s.replace(['nan', 'None', '', '-'], '0')
-        
-        # Vectorized string operations: remove commas, spaces, newlines
-        s = s.str.replace(',', '', regex=False)
-        s = s.str.replace(' ', '', regex=False)
-        s = s.str.replace('\n', '', regex=False)
-        s = s.str.strip()
-        
-        # Handle trailing negatives (amount-) -> (-amount)
+    @staticmethod
+    def _clean_amount_vectorized(series: pd.Series) -> pd.Series:
+        """Vectorized amount cleaning - much faster than apply for large datasets.
+
+        The scalar _clean_amount remains only for extract_page_totals, where
+        a single regex match is converted.
+        """
+        # One compiled-regex pass strips commas and all whitespace (which
+        # also covers the old strip); to_numeric's coercion then maps every
+        # non-numeric leftover ('nan', 'None', '', '-') to NaN, so the
+        # exact-match replace pass is unnecessary.
+        s = series.astype(str).str.replace(_AMOUNT_STRIP_RE, '', regex=True)
+
+        # Handle trailing negatives (amount-) -> (-amount); .loc rewrites
+        # only the matching rows
         trailing_neg = s.str.endswith('-')
-        s.loc[trailing_neg] = '-' + s.loc[trailing_neg].str[:-1]
-        
+        if trailing_neg.any():
+            s.loc[trailing_neg] = '-' + s.loc[trailing_neg].str[:-1]
+
         # Convert to numeric, coerce errors to 0
-        result = pd.to_numeric(s, errors='coerce').fillna(0.0)
-        
-        return result
+        return pd.to_numeric(s, errors='coerce').fillna(0.0)
+
+    def _map_to_canonical_transactions(self, df: pd.DataFrame, header_lookup: Dict[str, str]) -> Dict[str, list]:
+        """Map a raw Camelot table to {canonical column: list of values}.
 
-    def _map_to_canonical_transactions(self, df: pd.DataFrame, header_lookup: Dict[str, str]) -> pd.DataFrame:
+        Plain lists are accumulated per table and turned into a single
+        DataFrame at the end of extraction, instead of building (and later
+        concatenating and reindexing) one DataFrame per table.
+        """
         alias_lookup = self._get_transaction_alias_lookup()
         column_map: Dict[str, str] = {}
 
@@ -332,45 +690,41 @@ class BankStatementParser:
                 if idx < len(df.columns)
             }
 
-        canonical_df = pd.DataFrame(index=df.index)
+        n_rows = len(df)
+        columns: Dict[str, list] = {}
 
         for canonical in self.EXPECTED_TRANSACTION_COLUMNS:
             source_col = column_map.get(canonical)
             if source_col in df.columns:
-                canonical_df[canonical] = df[source_col]
+                columns[canonical] = df[source_col].tolist()
             else:
-                canonical_df[canonical] = pd.Series(pd.NA, index=df.index)
+                columns[canonical] = [None] * n_rows
 
-        return canonical_df
+        return columns
 
     def _normalize_header(self, header: str) -> str:
         if header is None:
             return ''
-        return re.sub(r'[^a-z0-9]', '', str(header).lower())
+        return _NORMALIZE_RE.sub('', str(header).lower())
 
     def _get_transaction_alias_lookup(self) -> Dict[str, str]:
-        if not hasattr(self, '_transaction_alias_lookup'):
-            lookup: Dict[str, str] = {}
-            for canonical, aliases in self.TRANSACTION_COLUMN_ALIASES.items():
-                for alias in aliases:
-                    normalized = self._normalize_header(alias)
-                    if normalized:
-                        lookup[normalized] = canonical
-            self._transaction_alias_lookup = lookup
-        return self._transaction_alias_lookup
+        return self._ALIAS_LOOKUP
 
     def _separate_header(self, table_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, str]]:
-        header_indices = table_df[
-            table_df.iloc[:, 0].astype(str).str.contains('Sl', na=False, case=False)
-        ].index
+        # Camelot puts the header in the first row or two, so probe a few
+        # cells directly instead of scanning the whole first column
+        header_idx = None
+        for i in range(min(3, len(table_df))):
+            if 'sl' in str(table_df.iat[i, 0]).lower():
+                header_idx = i
+                break
 
-        if len(header_indices) > 0:
-            header_idx = header_indices[0]
+        if header_idx is not None:
             header_row = table_df.iloc[header_idx].fillna('').astype(str)
             body_df = table_df.iloc[header_idx + 1:].reset_index(drop=True)
         else:
             header_row = pd.Series([''] * table_df.shape[1])
-            body_df = table_df.copy().reset_index(drop=True)
+            body_df = table_df.reset_index(drop=True)
 
         header_lookup = {
             table_df.columns[idx]: header_row.iloc[idx]
@@ -380,24 +734,20 @@ class BankStatementParser:
         return body_df, header_lookup
 
     def extract_page_totals(self) -> Dict[str, float]:
-        """Extract page totals from the second-to-last page."""
+        """Extract page totals from the second-to-last page.
+
+        The page text comes from the memoized _get_page_text, so the overlap
+        with extract_legends costs one extraction, not two.
+        """
         # Get the second-to-last page (which should have the totals)
         if self.total_pages >= 2:
-            page = self.doc[self.total_pages - 2]
-            text = page.get_text()
+            text = self._get_page_text(self.total_pages - 2)
 
             totals = {}
 
-            # Extract totals using regex
-            patterns = {
-                'opening_balance': r'Opening Bal:\s*([-]?[\d,]+\.[\d]+)',
-                'withdrawals': r'Withdrawls:\s*([\d,]+\.[\d]+)',
-                'deposits': r'Deposits:\s*([\d,]+\.[\d]+)',
-                'closing_balance': r'Closing Bal:\s*([-]?[\d,]+\.[\d]+)',
-            }
-
-            for key, pattern in patterns.items():
-                match = re.search(pattern, text)
+            # Extract totals using the precompiled patterns
+            for key, pattern in _TOTALS_PATTERNS.items():
+                match = pattern.search(text)
                 if match:
                     totals[key] = self._clean_amount(match.group(1))
 
@@ -406,27 +756,33 @@ class BankStatementParser:
         return {}
 
     def extract_legends(self) -> pd.DataFrame:
-        """Extract transaction code legends from the last two pages."""
-        legends = []
+        """Extract transaction code legends from the last two pages.
 
-        # Extract from the last two pages
+        Page text comes from the memoized _get_page_text, so a full parse()
+        extracts each tail page once even though totals reads one of them
+        too.
+        """
         start_page = max(0, self.total_pages - 2)
-        for page_num in range(start_page, self.total_pages):
-            page = self.doc[page_num]
-            text = page.get_text()
+        text = '\n'.join(
+            self._get_page_text(page_num)
+            for page_num in range(start_page, self.total_pages)
+        )
 
-            # Find all legend entries (number. CODE - Description)
-            pattern = r'(\d+)\.\s+([A-Z/\s]+?)\s+-\s+(.+?)(?=\n\d+\.|$)'
-            matches = re.findall(pattern, text, re.DOTALL)
+        # One findall over the joined text (number. CODE - Description),
+        # then vectorized cleanup on whole columns instead of a Python
+        # dict per match
+        matches = _LEGEND_PATTERN.findall(text)
+        if not matches:
+            return pd.DataFrame()
 
-            for match in matches:
-                legends.append({
-                    'number': match[0].strip(),
-                    'code': match[1].strip(),
-                    'description': match[2].strip().replace('\n', ' ')
-                })
+        legends_df = pd.DataFrame(matches, columns=['number', 'code', 'description'])
+        legends_df['number'] = legends_df['number'].str.strip()
+        legends_df['code'] = legends_df['code'].str.strip()
+        legends_df['description'] = (
+            legends_df['description'].str.replace('\n', ' ', regex=False).str.strip()
+        )
 
-        return pd.DataFrame(legends)
+        return legends_df
 
     def parse(self) -> Tuple[Dict, pd.DataFrame, Dict, pd.DataFrame]:
         """
@@ -436,62 +792,222 @@ class BankStatementParser:
             Tuple of (metadata_dict, transactions_df, totals_dict, legends_df)
         """
         tasks = ['Metadata', 'Transactions', 'Totals', 'Legends']
-        
+
         with tqdm(total=len(tasks), desc="Parsing PDF", unit="task") as pbar:
-            pbar.set_description("Extracting metadata")
-            metadata = self.extract_account_metadata()
-            pbar.update(1)
-            
-            pbar.set_description("Extracting transactions")
-            transactions = self.extract_transactions()
-            pbar.update(1)
-            
-            pbar.set_description("Extracting totals")
-            totals = self.extract_page_totals()
-            pbar.update(1)
-            
-            pbar.set_description("Extracting legends")
-            legends = self.extract_legends()
-            pbar.update(1)
+            # Warm the page-text cache for the pages the small extractors
+            # need before any thread starts: MuPDF documents are not
+            # thread-safe, so the background extractors must work from
+            # cached strings while extract_transactions drives MuPDF here.
+            if self.total_pages:
+                for page_index in {0, max(0, self.total_pages - 2),
+                                   self.total_pages - 1}:
+                    self._get_page_text(page_index)
+
+            # The metadata/totals/legends regex scans then overlap with the
+            # transaction extraction (Camelot pool spin-up or the word
+            # binning fast path) instead of running after it.
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                metadata_future = executor.submit(self.extract_account_metadata)
+                totals_future = executor.submit(self.extract_page_totals)
+                legends_future = executor.submit(self.extract_legends)
+
+                pbar.set_description("Extracting transactions")
+                transactions = self.extract_transactions()
+                pbar.update(1)
+
+                pbar.set_description("Extracting metadata")
+                metadata = metadata_future.result()
+                pbar.update(1)
+
+                pbar.set_description("Extracting totals")
+                totals = totals_future.result()
+                pbar.update(1)
+
+                pbar.set_description("Extracting legends")
+                legends = legends_future.result()
+                pbar.update(1)
         
         print("\n✓ Parsing complete!")
         return metadata, transactions, totals, legends
 
     def save_to_csv(self, output_dir: str = "data/output"):
-        """Parse and save all data to separate CSV files."""
+        """Parse and save all data to separate CSV files.
+
+        Transactions are streamed to disk chunk by chunk, so peak memory is
+        bounded by one page chunk rather than the whole statement.
+
+        Returns:
+            Tuple of (metadata_dict, transaction_count, totals_dict, legends_df)
+        """
         output_path = pathlib.Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        metadata, transactions, totals, legends = self.parse()
+        metadata = self.extract_account_metadata()
+        totals = self.extract_page_totals()
+        legends = self.extract_legends()
+
+        # Stream transactions incrementally instead of accumulating them
+        transactions_path = output_path / 'transactions.csv'
+        transaction_count = 0
+        first_chunk = True
+        for chunk_df in self.iter_transactions():
+            chunk_df.to_csv(transactions_path, mode='w' if first_chunk else 'a',
+                            header=first_chunk, index=False)
+            transaction_count += len(chunk_df)
+            first_chunk = False
+        if first_chunk:
+            # No transactions found: still emit the canonical header
+            pd.DataFrame(columns=self.EXPECTED_TRANSACTION_COLUMNS).to_csv(
+                transactions_path, index=False)
 
-        # Save all files with progress tracking
+        # Save the remaining (small) files with progress tracking
         files_to_save = [
             ('account_metadata.csv', pd.DataFrame([metadata]), 'metadata'),
-            ('transactions.csv', transactions, f'{len(transactions)} transactions'),
             ('page_totals.csv', pd.DataFrame([totals]), 'totals'),
             ('legends.csv', legends, f'{len(legends)} legends')
         ]
-        
+
         with tqdm(files_to_save, desc="Saving CSV files", unit="file") as pbar:
             for filename, df, description in pbar:
                 pbar.set_description(f"Saving {description}")
                 df.to_csv(output_path / filename, index=False)
-        
+
         print(f"\n✓ All files saved to {output_path}/")
-        return metadata, transactions, totals, legends
+        return metadata, transaction_count, totals, legends
 
-    def __del__(self):
-        """Close the PDF document."""
-        if hasattr(self, 'doc'):
+    def close(self) -> None:
+        """Close an owned PDF document and remove any spooled temp file.
+
+        Deterministic counterpart to __del__: call it (or use the parser as
+        a context manager) once extraction is done so MuPDF's mapped pages
+        are released instead of lingering until garbage collection.
+        Documents served by the _open_pdf cache stay open for reuse.
+        """
+        if getattr(self, '_owns_doc', False):
             self.doc.close()
+            self._owns_doc = False
+        if getattr(self, '_tmp_pdf_path', None):
+            pathlib.Path(self._tmp_pdf_path).unlink(missing_ok=True)
+            self._tmp_pdf_path = None
+
+    def __enter__(self) -> 'BankStatementParser':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __del__(self):
+        # Safety net for parsers not used as context managers; close() is
+        # idempotent, so an explicit earlier call makes this a no-op
+        self.close()
+
+
+# Fixed all-string schema for worker RecordBatches: an explicit schema
+# keeps batches concatenable even when a column is entirely null in some
+# chunk (inference would type it null and break Table.from_batches)
+if _HAS_PYARROW:
+    _TX_ARROW_SCHEMA = pa.schema(
+        [(col, pa.string()) for col in BankStatementParser.EXPECTED_TRANSACTION_COLUMNS]
+    )
+
+
+# Chunk directory and Camelot flavor shared by all tasks in a worker,
+# set by _worker_init
+_CHUNK_DIR = None
+_FLAVOR = 'lattice'
+
+
+def _chunk_file_name(chunk_idx: int) -> str:
+    """Canonical name of a split chunk PDF, shared by splitter and workers
+    so a task only needs to carry its integer index."""
+    return f'chunk_{chunk_idx:04d}.pdf'
+
+
+def _worker_init(chunk_dir: str, flavor: str) -> None:
+    """Initializer for spawn-context pool workers.
+
+    Under spawn each worker starts from a fresh interpreter; importing
+    camelot here pulls in its pdfminer/ghostscript machinery once at worker
+    startup instead of lazily inside the first task, and stashing the chunk
+    directory and probed flavor keeps them out of every task's pickle
+    payload.
+    """
+    global _CHUNK_DIR, _FLAVOR
+    import camelot  # noqa: F401
+    _CHUNK_DIR = chunk_dir
+    _FLAVOR = flavor
+
+
+def _process_page_chunk(chunk_idx: int) -> Tuple[int, List[Dict[str, list]]]:
+    """Worker for parallel processing of page chunks.
+
+    Each worker receives only the integer index of its pre-split chunk PDF
+    (_split_chunk_pdfs) and resolves the file against the _worker_init
+    chunk directory, so Camelot parses a small file front to back with
+    pages='all' instead of seeking a page range into the full statement.
+    The index is echoed back so the parent can re-sequence
+    completion-ordered results into page order.
+    """
+    chunk_pdf_path = os.path.join(_CHUNK_DIR, _chunk_file_name(chunk_idx))
+
+    # The parent probed the document flavor once (_detect_flavor), so each
+    # chunk is parsed exactly once with the flavor known to work
+    try:
+        if _FLAVOR == 'stream':
+            tables = camelot.read_pdf(
+                chunk_pdf_path,
+                pages='all',
+                flavor='stream',
+                edge_tol=50,
+                row_tol=10,
+                strip_text='\n'
+            )
+        else:
+            tables = camelot.read_pdf(
+                chunk_pdf_path,
+                pages='all',
+                flavor='lattice',
+                strip_text='\n'
+            )
+    except _CAMELOT_READ_ERRORS:
+        return chunk_idx, []
+
+    chunk_transactions = []
+    parser = BankStatementParser.__new__(BankStatementParser)
+
+    for table in tables:
+        raw_df = table.df
+        if raw_df.shape[0] == 0:
+            continue
+
+        df, header_lookup = parser._separate_header(raw_df)
+        if df.shape[0] == 0:
+            continue
+
+        # Optimized filtering: combined regex pattern
+        df = parser._filter_non_transaction_rows(df)
+
+        if len(df) > 0:
+            columns = parser._map_to_canonical_transactions(df, header_lookup)
+            if _HAS_PYARROW:
+                # RecordBatches pickle as compact Arrow IPC buffers instead
+                # of per-cell Python objects, and the parent concatenates
+                # them by pointer
+                chunk_transactions.append(
+                    pa.RecordBatch.from_pydict(columns, schema=_TX_ARROW_SCHEMA)
+                )
+            else:
+                chunk_transactions.append(columns)
+
+    return chunk_idx, chunk_transactions
 
 
 def main():
     """Main function to parse the bank statement PDF."""
     pdf_path = "data/ingest/test (dragged).pdf"
 
-    parser = BankStatementParser(pdf_path)
-    metadata, transactions, totals, legends = parser.save_to_csv()
+    with BankStatementParser(pdf_path) as parser:
+        metadata, transaction_count, totals, legends = parser.save_to_csv()
 
     # Display summary
     print("\n" + "="*60)
@@ -500,7 +1016,7 @@ def main():
     print(f"\nAccount: {metadata.get('name', 'N/A')}")
     print(f"Account Number: {metadata.get('account_number', 'N/A')}")
     print(f"Period: {metadata.get('transaction_period', 'N/A')}")
-    print(f"\nTotal Transactions: {len(transactions)}")
+    print(f"\nTotal Transactions: {transaction_count}")
     print(f"Opening Balance: {totals.get('opening_balance', 0):,.2f}")
     print(f"Total Withdrawals: {totals.get('withdrawals', 0):,.2f}")
     print(f"Total Deposits: {totals.get('deposits', 0):,.2f}")